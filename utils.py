@@ -11,7 +11,10 @@ Utility module for search and verification algorithms.
 """
 
 from sage.all import *
-from itertools import combinations_with_replacement
+from functools import lru_cache, partial
+from multiprocessing import Pool
+import itertools
+import math
 
 # Bitlength thresholds for different attacks security considerations
 POLLARD_RHO_SECURITY = 125
@@ -19,14 +22,15 @@ SEXTIC_EXTENSION_SECURITY = 125
 POLLARD_RHO_TWIST_SECURITY = 100
 EMBEDDING_DEGREE_SECURITY = 200
 DISCRIMINANT_SECURITY = 100
-# For Pollard-Rho security analysis
-PI_4 = (pi/4).numerical_approx()
+# For Pollard-Rho security analysis, as a double-precision float
+PI_4 = math.pi / 4
 
 
 ######################
 #  HELPER FUNCTIONS  #
 ######################
 
+@cached_function
 def make_finite_field(k):
     r""" Return the finite field isomorphic to this field.
 
@@ -35,11 +39,9 @@ def make_finite_field(k):
     - ``k`` -- a finite field
 
     OUTPUT: a tuple `(k_1,\phi,\xi)` where `k_1` is a 'true' finite field,
-    `\phi` is an isomorphism from `k` to `k_1` and `\xi` is an isomorphism
+    `\phi` is an isomorphism from `k` to `k_1` and `\xi` is its inverse,
     from `k_1` to `k`.
 
-    ***NOTE***: `\phi` and `\psi` are not inverses of each other.
-
     This function is useful when `k` is constructed as a tower of extensions
     with a finite field as a base field.
 
@@ -70,15 +72,45 @@ def make_finite_field(k):
         phi = k.hom(Pk0.gen(), Pk0, check=False)
         phi = phi.post_compose(psi)
 
-        k_inv = k0.base_ring()
-        phi0_inv = k_inv.hom(k_inv.gen(), k_inv)
-        G_new_inv = k_new.modulus().map_coefficients(phi0_inv, k0_new)
-        alpha_inv = G_new_inv.roots(k)[0][0]
+        # Obtain the preimage of the generator of k_new by solving the linear
+        # system given by phi over the prime field, rather than by finding a
+        # root of the modulus of k_new in k.
+        basis = _prime_field_basis(k)
+        M = matrix(k_new.prime_subfield(), [phi(b)._vector_() for b in basis]).transpose()
+        coords = M.solve_right(k_new.gen()._vector_())
+        alpha_inv = sum(c * b for c, b in zip(coords, basis))
         phi_inv = k_new.hom(alpha_inv, k)
 
         return k_new, phi, phi_inv
 
 
+def _prime_field_basis(k):
+    # Basis of a tower of finite field extensions `k` seen as
+    # a vector space over its prime field.
+    gen_powers = [k.gen() ** j for j in range(k.modulus().degree())]
+    if k.base_ring().is_prime_field():
+        return gen_powers
+    return [k(b) * g for g in gen_powers for b in _prime_field_basis(k.base_field())]
+
+
+def curve_order(curve):
+    r"""Return the number of points of an elliptic curve.
+
+    INPUT:
+
+    - ``curve`` -- the elliptic curve
+
+    OUTPUT: the number of points of `curve`, as `Integer`.
+
+    Sage stores the number of points on the curve itself once counted, so that
+    the different security checks on a same curve only count points once.
+    """
+
+    # Sage dispatches point counting over non-prime fields to PARI's
+    # `ellcard`, which relies on the SEA algorithm for large characteristic.
+    return Integer(curve.cardinality())
+
+
 def poly_weight(poly, p):
     r"""Return the weight of a polynomial seen as sum of its coefficients
     absolute values, when seen as field elements.
@@ -150,7 +182,12 @@ def find_sparse_irreducible_poly(ring, degree, use_root=False, max_coeff=10):
     return 0
 
 
-def find_irreducible_poly(ring, degree, use_root=False, max_coeff=3, output_all=False):
+# Cache of `find_irreducible_poly()` results. A plain dict is used instead of
+# `lru_cache` so that the `processes` argument is not part of the cache key.
+_IRREDUCIBLE_POLY_CACHE = {}
+
+
+def find_irreducible_poly(ring, degree, use_root=False, max_coeff=3, output_all=False, processes=1):
     r"""Return a list of irreducible polynomials with small and few coefficients.
 
     INPUT:
@@ -161,51 +198,102 @@ def find_irreducible_poly(ring, degree, use_root=False, max_coeff=3, output_all=
                       or using also an element not belonging to the base field (default False)
     - ``max_coeff`` -- maximum absolute value for polynomial coefficients
     - ``output_all`` -- boolean indicating whether outputting only one polynomial or all (default False)
+    - ``processes`` -- number of concurrent jobs testing candidates for irreducibility (default 1)
 
     OUTPUT: a list of irreducible polynomials.
 
     The default behaviour, to return a single polynomial, still outputs a list of length 1 to keep the
     function output consistent when `output_all == True`.
 
+    Candidates are processed in the same order regardless of `processes`, hence the output is
+    deterministic. Note that `processes` must be 1 when called from a daemonic process (such as
+    a `multiprocessing.Pool` worker).
+
     """
 
-    x = ring.gen()
+    # Results do not depend on `processes`, hence it is left out of the cache key.
+    key = (ring, degree, use_root, max_coeff, output_all)
+    if key not in _IRREDUCIBLE_POLY_CACHE:
+        _IRREDUCIBLE_POLY_CACHE[key] = _find_irreducible_poly(*key, processes)
+    # Results are cached, hence return a copy that callers can freely modify.
+    return list(_IRREDUCIBLE_POLY_CACHE[key])
+
+
+def _find_irreducible_poly(ring, degree, use_root, max_coeff, output_all, processes):
+    nb_candidates = len(_coefficient_candidates(degree, max_coeff))
+    chunk_size = ceil(nb_candidates / (4 * processes))
+    tasks = ((degree, max_coeff, start, start + chunk_size, None, output_all)
+             for start in range(0, nb_candidates, chunk_size))
+    if use_root:
+        # For polynomials involving `root`, split the search on the regular coefficients.
+        # These tasks are generated lazily, only once the previous ones have failed.
+        tasks = itertools.chain(tasks, ((degree, max_coeff, 0, nb_candidates, regular_coeffs, output_all)
+                                        for regular_coeffs in _coefficient_candidates(degree, max_coeff)))
+
+    if processes == 1:
+        return _collect_irreducible_polys(
+            tasks, lambda batch: map(partial(_find_irreducible_poly_chunk, ring=ring), batch), 1, output_all)
+    # The ring is sent once to each worker, rather than along with every task
+    with Pool(processes=processes, initializer=_init_irreducible_poly_worker, initargs=(ring,)) as pool:
+        return _collect_irreducible_polys(
+            tasks, lambda batch: pool.imap(_find_irreducible_poly_chunk, batch), 4 * processes, output_all)
+
+
+def _collect_irreducible_polys(tasks, run, batch_size, output_all):
+    # Tasks are run by batches of `batch_size`, so that `Pool.imap` does not queue
+    # all of them at once. `run` yields lists of irreducible polynomials in candidates order.
+    list_poly = []
+    while True:
+        batch = list(itertools.islice(tasks, batch_size))
+        if batch == []:
+            return tuple(list_poly)
+        for polys in run(batch):
+            list_poly += polys
+            # Exhaustive search usually becomes too heavy with `root`,
+            # hence stop as soon as one solution is found
+            if not output_all and list_poly != []:
+                return (list_poly[0],)
+
+
+@lru_cache(maxsize=None)
+def _coefficient_candidates(degree, max_coeff):
+    # Candidates are sorted by number of non-zero coefficients, so that the
+    # first irreducible polynomial found is also one of the sparsest.
+    return sorted(itertools.product(range(-max_coeff, max_coeff + 1), repeat=degree),
+                  key=lambda t: sum(1 for c in t if c != 0))
+
+
+_worker_ring = None
+
 
-    set_coeffs_1 = set(combinations_with_replacement(
-        range(-max_coeff, max_coeff), degree))
-    set_coeffs_2 = set(combinations_with_replacement(
-        reversed(range(-max_coeff, max_coeff)), degree))
-    set_coeffs = set_coeffs_1.union(set_coeffs_2)
+def _init_irreducible_poly_worker(ring):
+    global _worker_ring
+    _worker_ring = ring
+
+
+def _find_irreducible_poly_chunk(task, ring=None):
+    # Test a slice of the coefficient candidates for irreducibility. This is
+    # a module-level function so that it can be sent to `Pool` workers, which
+    # receive `ring` through `_init_irreducible_poly_worker()`.
+    ring = ring if ring is not None else _worker_ring
+    degree, max_coeff, start, stop, regular_coeffs, output_all = task
+    root = ring.base().gen()
 
     list_poly = []
-    for coeffs in set_coeffs:
-        p = x ** degree
-        for n in range(len(coeffs)):
-            p += coeffs[n]*x ** n
+    for coeffs in _coefficient_candidates(degree, max_coeff)[start:stop]:
+        if regular_coeffs is None:
+            p = ring(list(coeffs) + [1])
+        elif any(coeffs):
+            p = ring([c + root * s for c, s in zip(regular_coeffs, coeffs)] + [1])
+        else:
+            # Polynomials without `root` are tested in other chunks
+            continue
         if p.is_irreducible():
             list_poly.append(p)
+            if not output_all:
+                break
 
-    if use_root:
-        root = ring.base().gen()
-        for regular_coeffs in set_coeffs:
-            p = x ** degree
-            for n in range(len(regular_coeffs)):
-                p += regular_coeffs[n]*x ** n
-            for special_coeffs in set_coeffs:
-                q = p
-                for n in range(len(special_coeffs)):
-                    q += root * special_coeffs[n]*x ** n
-                if q.is_irreducible():
-                    list_poly.append(q)
-                    # Exhaustive search usually becomes too heavy with this,
-                    # hence stop as soon as one solution is found
-                    if not output_all:
-                        return [min(list_poly, key=lambda t: len(t.coefficients()))]
-
-    if output_all or list_poly == []:
-        return list_poly
-    else:
-        return [min(list_poly, key=lambda t: len(t.coefficients()))]
+    return list_poly
 
 
 def display_result(
@@ -251,37 +339,45 @@ def display_result(
     def color(bool):
         return colored(bool, 'green' if bool else 'red')
 
-    output = "-----------------------------------------------------------------------------------------\n"
-    output += "|                                                                                       |\n"
-    output += "|\t\t\t    -------------------------------\t\t\t\t|\n"
-    output += "|\t\t\t    |  Cheetah Security Analysis  |\t\t\t\t|\n"
-    output += "|\t\t\t    -------------------------------\t\t\t\t|\n"
-    output += "|                                                                                       |\n"
-    output += "|\t\t\t      E(F_p^6): y^2 = x^3 + x + B\t\t\t\t|\n"
-    output += f"|\t\t\t   #E = q.h, q {q_nbits}-bit subgroup order\t\t\t\t|\n"
-    output += "|                                                                                       |\n"
-    output += f"|\tp is prime: {color(p_isprime)}\t\t\t\t\t\t\t\t|\n"
-    output += f"|\tq is prime: {color(q_isprime)}\t\t\t\t\t\t\t\t|\n"
-    output += f"|\tcurve is secure against the Pollard-Rho attack: {color(is_pollard_rho_secure)} ({e_security[0]:.2f} bits)\t\t|\n"
-    output += f"|\tcurve is secure against MOV attack: {color(is_mov_secure)} (curve embedding degree > 2^{e_security[1].nbits()})\t|\n"
-    output += f"|\ttwist is secure against the Pollard-Rho attack: {color(twist_is_pollard_rho_secure)} ({t_security[0]:.2f} bits)\t\t|\n"
-    output += f"|\ttwist is secure against MOV attack: {color(twist_is_mov_secure)} (twist embedding degree > 2^{t_security[1].nbits()})\t|\n"
-    output += f"|\tcurve has large enough complex discriminant: {color(is_discriminant_large)} (discriminant > 2^{discriminant_nbits})\t|\n"
-    output += f"|\tcurve is secure against genus 2 cover attack: {color(is_genus_2_secure)}\t\t\t\t|\n"
-    output += f"|\tcurve is secure against genus 3 hyperelliptic cover attack: {color(is_genus_3_h_secure)}\t\t|\n"
-    output += f"|\tcurve is secure against genus 3 non-hyperelliptic cover attack: {color(is_genus_3_nh_secure)}\t\t|\n"
-    output += f"|\tcurve is secure against GHS attack: {color(is_ghs_secure)}\t\t\t\t\t|\n"
-    output += "|                                                                                       |\n"
-    output += "-----------------------------------------------------------------------------------------\n"
-
-    print(output)
+    # An embedding degree of 0 means that it has not been evaluated,
+    # as the Pollard-Rho security was already too low.
+    def embedding_degree_bound(k):
+        return f"> 2^{k.nbits()}" if k != 0 else "not evaluated"
+
+    lines = [
+        "-----------------------------------------------------------------------------------------",
+        "|                                                                                       |",
+        "|\t\t\t    -------------------------------\t\t\t\t|",
+        "|\t\t\t    |  Cheetah Security Analysis  |\t\t\t\t|",
+        "|\t\t\t    -------------------------------\t\t\t\t|",
+        "|                                                                                       |",
+        "|\t\t\t      E(F_p^6): y^2 = x^3 + x + B\t\t\t\t|",
+        f"|\t\t\t   #E = q.h, q {q_nbits}-bit subgroup order\t\t\t\t|",
+        "|                                                                                       |",
+        f"|\tp is prime: {color(p_isprime)}\t\t\t\t\t\t\t\t|",
+        f"|\tq is prime: {color(q_isprime)}\t\t\t\t\t\t\t\t|",
+        f"|\tcurve is secure against the Pollard-Rho attack: {color(is_pollard_rho_secure)} ({e_security[0]:.2f} bits)\t\t|",
+        f"|\tcurve is secure against MOV attack: {color(is_mov_secure)} (curve embedding degree {embedding_degree_bound(e_security[1])})\t|",
+        f"|\ttwist is secure against the Pollard-Rho attack: {color(twist_is_pollard_rho_secure)} ({t_security[0]:.2f} bits)\t\t|",
+        f"|\ttwist is secure against MOV attack: {color(twist_is_mov_secure)} (twist embedding degree {embedding_degree_bound(t_security[1])})\t|",
+        f"|\tcurve has large enough complex discriminant: {color(is_discriminant_large)} (discriminant > 2^{discriminant_nbits})\t|",
+        f"|\tcurve is secure against genus 2 cover attack: {color(is_genus_2_secure)}\t\t\t\t|",
+        f"|\tcurve is secure against genus 3 hyperelliptic cover attack: {color(is_genus_3_h_secure)}\t\t|",
+        f"|\tcurve is secure against genus 3 non-hyperelliptic cover attack: {color(is_genus_3_nh_secure)}\t\t|",
+        f"|\tcurve is secure against GHS attack: {color(is_ghs_secure)}\t\t\t\t\t|",
+        "|                                                                                       |",
+        "-----------------------------------------------------------------------------------------",
+        "",
+    ]
+
+    print("\n".join(lines))
 
 
 ##############################
 #  CURVE SECURITY FUNCTIONS  #
 ##############################
 
-def generic_curve_security(p, q, main_factor=0, main_factor_m1_factors_list=[]):
+def generic_curve_security(p, q, main_factor=0, main_factor_m1_factors_list=[], rho_security=POLLARD_RHO_SECURITY):
     r""" Return the estimated cost of running Pollard-Rho against
     the curve main subgroup, and the curve embedding degree.
 
@@ -293,9 +389,12 @@ def generic_curve_security(p, q, main_factor=0, main_factor_m1_factors_list=[]):
         and can be given to speed-up calculations. (default 0)
     - ``main_factor_m1_factors_list`` -- the factorization of `main_factor` - 1.
         This parameter is optional and can be given to speed-up calculations. (default [])
+    - ``rho_security`` -- the Pollard-Rho security threshold below which the embedding degree
+        is not computed. (default POLLARD_RHO_SECURITY)
 
     OUTPUT: a tuple `(rho_sec, k)` where `rho_sec` is the estimated cost of running
-    Pollard-Rho attack on the curve, and `k` is the curve embedding degree.
+    Pollard-Rho attack on the curve, and `k` is the curve embedding degree, or 0 if
+    `rho_sec` is below `rho_security` and the embedding degree has not been evaluated.
     """
 
     # Ensure that `main_factor` is valid (if provided)
@@ -311,8 +410,15 @@ def generic_curve_security(p, q, main_factor=0, main_factor_m1_factors_list=[]):
         assert(prod(x ** y for x, y in main_factor_m1_factors_list)
                == main_factor - 1)
 
-    r = main_factor if main_factor != 0 else ecm.factor(q)[-1]
-    return (log(PI_4 * r, 4), embedding_degree(p, r, main_factor_m1_factors_list))
+    r = main_factor if main_factor != 0 else _largest_prime_factor(q)
+    rho_sec = _pollard_rho_security(r)
+    # The curve is insecure anyway, hence skip the costly embedding degree calculation
+    if rho_sec < rho_security:
+        return (rho_sec, Integer(0))
+
+    rm1_factors_list = main_factor_m1_factors_list if main_factor_m1_factors_list != [] else list(
+        factor(r - 1))
+    return (rho_sec, embedding_degree(p, r, rm1_factors_list))
 
 
 def embedding_degree(p, r, rm1_factors_list=[]):
@@ -332,18 +438,35 @@ def embedding_degree(p, r, rm1_factors_list=[]):
     # method is always called from `generic_curve_security()` which
     # performs the check.
 
+    return _embedding_degree(p, r, tuple((f, e) for f, e in rm1_factors_list))
+
+
+# Arguments change with every curve being analyzed, hence keep the
+# cache small so that it does not grow unboundedly in search loops.
+@lru_cache(maxsize=16)
+def _embedding_degree(p, r, rm1_factors_list):
     assert gcd(p, r) == 1
-    Z_r = Integers(r)
-    u = Z_r(p)
-    d = r - 1
-    factors = rm1_factors_list if rm1_factors_list != [] else factor(d)
-    for (f, _multiplicity) in factors:
-        while d % f == 0:
-            if u**(d/f) != 1:
-                break
-            d /= f
+    # The embedding degree is the multiplicative order of p modulo r, which
+    # PARI's `znorder` computes directly from a factorization of r - 1.
+    # We call it on a PARI element to bypass the `Integers(r)` wrapper.
+    u = pari.Mod(p, r)
+    if rm1_factors_list == ():
+        return Integer(u.znorder())
+    factors_matrix = pari.matrix(len(rm1_factors_list), 2,
+                                 [e for f in rm1_factors_list for e in f])
+    return Integer(u.znorder(factors_matrix))
 
-    return Integer(d)
+
+@lru_cache(maxsize=16)
+def _largest_prime_factor(n):
+    return ecm.factor(n)[-1]
+
+
+def _pollard_rho_security(r):
+    # Double precision is plenty to compare the result against the security
+    # thresholds, and avoids going through Sage symbolic logarithms. `math.log`
+    # accepts arbitrarily large ints, whereas `float(r)` overflows above 2^1024.
+    return math.log(int(r), 4) + math.log(PI_4, 4)
 
 
 def generic_twist_security(p, q, main_factor_of_2pp1mq=0, main_factor_of_2pp1mq_m1_factors_list=[]):
@@ -360,13 +483,15 @@ def generic_twist_security(p, q, main_factor_of_2pp1mq=0, main_factor_of_2pp1mq_
         This parameter is optional and can be given to speed-up calculations. (default [])
 
     OUTPUT: a tuple `(rho_sec, k)` where `rho_sec` is the estimated cost of running
-    Pollard-Rho attack on the twist, and `k` is the twist embedding degree.
+    Pollard-Rho attack on the twist, and `k` is the twist embedding degree, or 0 if
+    `rho_sec` is below `POLLARD_RHO_TWIST_SECURITY` and the embedding degree has not been evaluated.
     """
 
     # Validity checks on `main_factor_of_2pp1mq` and `main_factor_of_2pp1mq_m1_factors_list`
     # are performed inside `generic_curve_security()` (if provided)
 
-    return generic_curve_security(p, 2*(p+1) - q, main_factor_of_2pp1mq, main_factor_of_2pp1mq_m1_factors_list)
+    return generic_curve_security(p, 2*(p+1) - q, main_factor_of_2pp1mq, main_factor_of_2pp1mq_m1_factors_list,
+                                  POLLARD_RHO_TWIST_SECURITY)
 
 
 def generic_twist_security_ignore_embedding_degree(p, q, main_factor_of_2pp1mq=0):
@@ -390,9 +515,9 @@ def generic_twist_security_ignore_embedding_degree(p, q, main_factor_of_2pp1mq=0
         assert(main_factor_of_2pp1mq.is_prime(proof=True))
         assert((2*(p+1) - q) % main_factor_of_2pp1mq == 0)
 
-    r = main_factor_of_2pp1mq if main_factor_of_2pp1mq != 0 else ecm.factor(
-        2*(p+1) - q)[-1]
-    return log(PI_4 * r, 4)
+    r = main_factor_of_2pp1mq if main_factor_of_2pp1mq != 0 else _largest_prime_factor(
+        2*(p+1) - q)
+    return _pollard_rho_security(r)
 
 
 def sextic_extension_specific_security(curve, curve_coeff_a, curve_coeff_b, field_characteristic, number_points=0):
@@ -413,25 +538,28 @@ def sextic_extension_specific_security(curve, curve_coeff_a, curve_coeff_b, fiel
     OUTPUT: a boolean indicating whether the given `curve` is resistant to the attacks.
     """
 
-    sec_g2 = genus_2_cover_security(curve)
-    sec_g3_h = genus_3_hyperelliptic_cover_security(curve, number_points)
-    sec_g3_nh = genus_3_hyperelliptic_cover_security(curve)
+    n = number_points if number_points != 0 else curve_order(curve)
+    sec_g2 = genus_2_cover_security(curve, n)
+    sec_g3_h = genus_3_hyperelliptic_cover_security(curve, n)
+    sec_g3_nh = genus_3_nonhyperelliptic_cover_security(curve)
     sec_ghs = ghs_security(curve_coeff_a, curve_coeff_b, field_characteristic)
 
     return sec_g2 and sec_g3_h and sec_g3_nh and sec_ghs
 
 
-def genus_2_cover_security(curve):
+def genus_2_cover_security(curve, number_points=0):
     r""" Return whether the given `curve` is resistant to genus 2 cover attacks.
 
     INPUT:
 
     - ``curve`` -- the elliptic curve
+    - ``number_points`` -- the number of points of the elliptic curve.
+        This parameter is optional and can be given to speed-up calculations. (default 0)
 
     OUTPUT: a boolean indicating whether the given `curve` is resistant to genus 2 cover attacks.
     """
 
-    n = curve.count_points()
+    n = number_points if number_points != 0 else curve_order(curve)
     # We don't perform any check on the j-invariant because of the
     # limitations of Sagemath with extension based elliptic curves.
     # Hence having an odd number of points directly lead to considering
@@ -452,7 +580,7 @@ def genus_3_hyperelliptic_cover_security(curve, number_points=0):
     OUTPUT: a boolean indicating whether the given `curve` is resistant to genus 3 hyperelliptic cover attacks.
     """
 
-    n = number_points if number_points != 0 else curve.count_points()
+    n = number_points if number_points != 0 else curve_order(curve)
     p = curve.base_field().characteristic()
     if n % 4 == 0:
         return p.nbits() * 5.0/3 > SEXTIC_EXTENSION_SECURITY
@@ -472,7 +600,9 @@ def genus_3_nonhyperelliptic_cover_security(curve):
     q = curve.base_ring().characteristic() ** 2
     # Kim Laine and Kristin Lauter. Time-memory trade-offs for index calculus
     # in genus 3. Journal of Mathematical Cryptology, 9(2):95-114, 2015
-    return log(1.23123 * log(q, 2) ** 2 * q, 2).numerical_approx() > SEXTIC_EXTENSION_SECURITY
+    # log2(1.23123 * log2(q)^2 * q), evaluated with floating-point logarithms only
+    log2_q = RR(q).log2()
+    return RR(1.23123).log2() + 2 * log2_q.log2() + log2_q > SEXTIC_EXTENSION_SECURITY
 
 
 def ghs_security(curve_coeff_a, curve_coeff_b, curve_basefield):
@@ -509,9 +639,12 @@ def ghs_security(curve_coeff_a, curve_coeff_b, curve_basefield):
     x = K.gen()
     curve_polynomial = K(x ** 3 + psi(curve_coeff_a)*x + psi(curve_coeff_b))
 
-    roots = curve_polynomial.roots(multiplicities=False)
-    if roots != []:
-        for root in roots:
-            if (root ** (p**2) in roots) or (root ** (p**3) in roots):
-                return p.nbits() * 8.0 / 3 > SEXTIC_EXTENSION_SECURITY
+    roots = frozenset(curve_polynomial.roots(multiplicities=False))
+    for root in roots:
+        # Successive Frobenius images root^(p^2) and root^(p^3),
+        # obtained with exponents of size p only
+        root_p2 = (root ** p) ** p
+        root_p3 = root_p2 ** p
+        if (root_p2 in roots) or (root_p3 in roots):
+            return p.nbits() * 8.0 / 3 > SEXTIC_EXTENSION_SECURITY
     return True